@@ -7,17 +7,25 @@
 
 __version__ = "0.6.0"
 
+SEP = b":"
 END = b","
 END_ORD = ord(END)
+COMPACT_SIZE = 4096
+MAX_DIGITS = 20
 NEED_DATA = object()
 CONNECTION_CLOSED = object()
 
+_HEADERS = tuple(b"%d:" % n for n in range(1024))
+_VIEW_COPY_SIZE = 8192
+
 
 def encode(payload):
     """
     Convert a payload (bytes) to a netstring frame.
     """
-    return f"{len(payload)}:".encode() + payload + END
+    n = len(payload)
+    header = _HEADERS[n] if n < len(_HEADERS) else b"%d:" % n
+    return b"".join((header, payload, END))
 
 
 def decode(frame):
@@ -25,25 +33,110 @@ def decode(frame):
     Retrieve payload from the frame (bytes). Frame must be a complete netstring
     frame otherwise ValueError exception is raised.
     """
-    ndig = frame.index(b":")
-    n = int(frame[0:ndig])
-    start = ndig + 1
-    end = start + n + 1
-    if len(frame) < end:
+    try:
+        frame_span = _parse_frame(frame, 0)
+    except ValueError:
+        raise ValueError("Received frame with invalid format") from None
+    if frame_span is None:
         raise ValueError("Incomplete frame")
-    result = frame[start : end - 1]
-    if frame[end - 1] != END_ORD:
-        raise ValueError("Received frame with invalid format")
-    return result
+    start, end = frame_span
+    return frame[start : end - 1]
 
 
 dumps = encode
 loads = decode
 
 
+def _parse_frame(buf, pos):
+    """
+    Locate the netstring frame starting at pos in buf. Returns a tuple with
+    the payload start and the frame end offsets or None if the frame is
+    not complete. Raises ValueError if the data is malformed.
+    """
+    if pos >= len(buf):
+        return None
+    limit = pos + MAX_DIGITS + 1
+    colon = buf.find(SEP, pos, limit)
+    if colon < 0:
+        digits = buf[pos:limit]
+        if len(digits) > MAX_DIGITS or not digits.isdigit():
+            raise ValueError("Received data with invalid format")
+        return None
+    digits = buf[pos:colon]
+    if not digits.isdigit():
+        raise ValueError("Received data with invalid format")
+    start = colon + 1
+    end = start + int(digits) + 1
+    if len(buf) < end:
+        return None
+    if buf[end - 1] != END_ORD:
+        raise ValueError("Received data with invalid format")
+    return start, end
+
+
+def _parse_frames(buf, pos, source=None):
+    """
+    Parse all complete netstring frames in buf starting at pos. Returns the
+    list of payloads, sliced from source (or copied from buf if source is
+    None), the offset following the last frame and whether malformed data
+    follows it.
+    Malformed data with no complete frame before it raises ValueError.
+    """
+    events = []
+    size = len(buf)
+    malformed = False
+    while pos < size:
+        colon = buf.find(SEP, pos)
+        if colon < 0 or colon - pos > MAX_DIGITS:
+            digits = buf[pos : pos + MAX_DIGITS + 1]
+            malformed = len(digits) > MAX_DIGITS or not digits.isdigit()
+            break
+        digits = buf[pos:colon]
+        if not digits.isdigit():
+            malformed = True
+            break
+        start = colon + 1
+        stop = start + int(digits)
+        if stop >= size:
+            break
+        if buf[stop] != END_ORD:
+            malformed = True
+            break
+        # large payloads are copied once through a memoryview, small ones
+        # through a slice, which is faster for them despite the extra copy
+        if source is not None:
+            events.append(source[start:stop])
+        elif stop - start > _VIEW_COPY_SIZE:
+            events.append(bytes(memoryview(buf)[start:stop]))
+        else:
+            events.append(bytes(buf[start:stop]))
+        pos = stop + 1
+    if malformed and not events:
+        raise ValueError("Received data with invalid format")
+    return events, pos, malformed
+
+
 class Connection:
-    def __init__(self):
+    __slots__ = (
+        "_receive_buffer",
+        "_read_pos",
+        "_slot",
+        "_copy",
+        "_malformed",
+        "closed",
+        "__weakref__",
+    )
+
+    def __init__(self, copy=True):
+        """
+        If copy is False, events are returned as read-only memoryviews on the
+        received data instead of bytes copies (see `next_event_view()`).
+        """
         self._receive_buffer = b""
+        self._copy = copy
+        self._read_pos = 0
+        self._slot = None
+        self._malformed = False
         self.closed = False
 
     @property
@@ -53,7 +146,9 @@ class Connection:
         the unprocessed data itself, and the second is a bool that is True if
         the receive connection was closed.
         """
-        return self._receive_buffer, self.closed
+        buf = memoryview(self._receive_buffer)
+        end = len(buf) if self._slot is None else len(buf) - len(self._slot)
+        return bytes(buf[self._read_pos : end]), self.closed
 
     def send_data(self, event):
         """Convert a high-level event into bytes that can be sent to the peer"""
@@ -69,13 +164,80 @@ class Connection:
 
         Feeding data on a closed receiving end raises ValueError.
         """
+        if self._slot is not None:
+            raise ValueError("Pending receive slot must be committed first")
         if data:
             if self.closed:
                 raise ValueError("Cannot receive more data: received closed")
-            self._receive_buffer += data
+            buf = self._receive_buffer
+            if not buf and isinstance(data, bytes):
+                # nothing pending: keep the immutable chunk as is
+                self._receive_buffer = data
+                return
+            if not isinstance(buf, bytearray):
+                self._detach()
+            try:
+                self._receive_buffer.extend(data)
+            except BufferError:
+                self._detach()
+                self._receive_buffer.extend(data)
         else:
             self.close()
 
+    def recv_slot(self, size):
+        """Reserve `size` bytes at the end of the receive buffer and return a
+        writable memoryview on them so the I/O layer can fill them directly
+        (ex: `socket.recv_into()`), avoiding an intermediate bytes object.
+
+        Must be followed by a call to `commit()` before the connection is used
+        again (receiving or parsing with a pending slot raises ValueError):
+
+            slot = conn.recv_slot(4096)
+            conn.commit(sock.recv_into(slot))
+
+        Reserving a slot on a closed receiving end raises ValueError.
+        """
+        if self.closed:
+            raise ValueError("Cannot receive more data: received closed")
+        if self._slot is not None:
+            raise ValueError("Pending receive slot must be committed first")
+        if not isinstance(self._receive_buffer, bytearray):
+            self._detach()
+        start = len(self._receive_buffer)
+        try:
+            self._receive_buffer.extend(bytes(size))
+        except BufferError:
+            self._detach()
+            start = len(self._receive_buffer)
+            self._receive_buffer.extend(bytes(size))
+        self._slot = memoryview(self._receive_buffer)[start:]
+        return self._slot
+
+    def commit(self, size):
+        """Declare that the first `size` bytes of the slot returned by
+        `recv_slot()` were filled with network data. The remaining slot
+        bytes are discarded.
+
+        Committing zero bytes effectively closes the receiving end, the same
+        way feeding the empty bytes to `receive_data()` does.
+        """
+        slot = self._slot
+        if slot is None:
+            raise ValueError("No receive slot to commit")
+        if not 0 <= size <= len(slot):
+            raise ValueError("Commit size out of slot bounds")
+        self._slot = None
+        unused = len(slot) - size
+        slot.release()
+        if unused:
+            try:
+                del self._receive_buffer[-unused:]
+            except BufferError:
+                self._detach()
+                del self._receive_buffer[-unused:]
+        if not size:
+            self.close()
+
     def next_event(self):
         """Parse the next event out of our receive buffer, update our internal
         state, and return it.
@@ -94,43 +256,234 @@ class Connection:
 
         Raises ValueError or TypeError if the data feed is malformed
         """
-        if not self._receive_buffer:
+        buf = self._receive_buffer
+        if self._slot is not None:
+            raise ValueError("Pending receive slot must be committed first")
+        if not buf:
             return CONNECTION_CLOSED if self.closed else NEED_DATA
-        try:
-            ndig = self._receive_buffer.index(b":")
-        except ValueError:
-            try:
-                int(self._receive_buffer)
-            except ValueError:
+        pos = self._read_pos
+        size = len(buf)
+        colon = buf.find(SEP, pos)
+        if colon < 0 or colon - pos > MAX_DIGITS:
+            digits = buf[pos : pos + MAX_DIGITS + 1]
+            if len(digits) > MAX_DIGITS or not digits.isdigit():
                 self.close()
                 raise ValueError("Received data with invalid format")
             return CONNECTION_CLOSED if self.closed else NEED_DATA
-        n = int(self._receive_buffer[0:ndig])
-        start = ndig + 1
-        end = start + n + 1
-        if len(self._receive_buffer) < end:
+        digits = buf[pos:colon]
+        if not digits.isdigit():
+            self.close()
+            raise ValueError("Received data with invalid format")
+        start = colon + 1
+        stop = start + int(digits)
+        if stop >= size:
             return CONNECTION_CLOSED if self.closed else NEED_DATA
-        result = self._receive_buffer[start : end - 1]
-        if self._receive_buffer[end - 1] != END_ORD:
+        if buf[stop] != END_ORD:
             self.close()
             raise ValueError("Received data with invalid format")
-        self._receive_buffer = self._receive_buffer[end:]
-        return result
+        if not self._copy:
+            event = memoryview(buf)[start:stop].toreadonly()
+        elif isinstance(buf, bytes):
+            event = buf[start:stop]
+        elif stop - start > _VIEW_COPY_SIZE:
+            event = bytes(memoryview(buf)[start:stop])
+        else:
+            event = bytes(buf[start:stop])
+        end = stop + 1
+        if end == size:
+            self._receive_buffer = b""
+            self._read_pos = 0
+        elif end > COMPACT_SIZE and 2 * end > size:
+            self._advance(end)
+        else:
+            self._read_pos = end
+        return event
+
+    def next_event_view(self):
+        """Same as `next_event()` but the event is returned as a read-only
+        memoryview on the receive buffer instead of a bytes copy.
+
+        The view stays valid after more data is received. Use `bytes(view)`
+        if you need to own the payload.
+        """
+        copy = self._copy
+        self._copy = False
+        try:
+            return self.next_event()
+        finally:
+            self._copy = copy
+
+    def next_events(self):
+        """Parse all complete events out of our receive buffer, update our
+        internal state, and return them as a list.
+
+        Returns an empty list when no complete event is available (check
+        `closed` to know if more data can still arrive).
+
+        If malformed data follows complete events, these events are returned
+        and the ValueError is raised by the next call.
+        """
+        if self._slot is not None:
+            raise ValueError("Pending receive slot must be committed first")
+        buf = self._receive_buffer
+        if not self._copy:
+            source = memoryview(buf).toreadonly()
+        elif isinstance(buf, bytes):
+            source = buf
+        else:
+            source = None
+        try:
+            events, pos, self._malformed = _parse_frames(buf, self._read_pos, source)
+        except ValueError:
+            self.close()
+            raise
+        self._advance(pos)
+        return events
+
+    def feed(self, data):
+        """Feed network data into the connection instance and return the list
+        of complete events. Same as calling `receive_data(data)` followed by
+        `next_events()`.
+
+        When no unprocessed data is pending, complete frames are parsed
+        directly out of `data` (bytes) and only an incomplete tail is copied
+        into the receive buffer.
+        """
+        if self._receive_buffer or not data or not isinstance(data, bytes):
+            self.receive_data(data)
+            return self.next_events()
+        if self.closed:
+            raise ValueError("Cannot receive more data: received closed")
+        if self._slot is not None:
+            raise ValueError("Pending receive slot must be committed first")
+        source = data if self._copy else memoryview(data)
+        try:
+            events, pos, self._malformed = _parse_frames(data, 0, source)
+        except ValueError:
+            self.close()
+            raise
+        if pos < len(data):
+            self._receive_buffer = data
+            self._advance(pos)
+        return events
+
+    def _advance(self, pos):
+        """Move the read position to pos, right after the last parsed frame.
+
+        A fully consumed receive buffer is dropped straight away so idle
+        connections don't hold on to their largest burst. Otherwise consumed
+        bytes are only dropped when they make up most of the buffer, so the
+        remaining data is moved at most once per compaction instead of once
+        per event.
+        """
+        buf = self._receive_buffer
+        if pos == len(buf):
+            self._receive_buffer = b""
+            self._read_pos = 0
+        elif pos > COMPACT_SIZE and 2 * pos > len(buf):
+            self._receive_buffer = buf[pos:]
+            self._read_pos = 0
+        else:
+            self._read_pos = pos
+
+    def _detach(self):
+        """Move unprocessed data to a new, growable, receive buffer. The
+        current one is left to the event views that may still reference it.
+        """
+        buf = memoryview(self._receive_buffer)[self._read_pos :]
+        self._receive_buffer = bytearray(buf)
+        self._read_pos = 0
 
     def close(self):
+        if self._slot is not None:
+            self._slot.release()
+            self._slot = None
         self.closed = True
         self._receive_buffer = b""
+        self._read_pos = 0
+        self._malformed = False
+
+    def reset(self):
+        """Bring the connection back to its initial state (empty receive
+        buffer, receiving end open) so it can be reused for a new stream
+        instead of creating a new Connection. Example of a pool:
+
+            pool = queue.SimpleQueue()
+
+            def handle(source):
+                try:
+                    conn = pool.get_nowait()
+                except queue.Empty:
+                    conn = Connection()
+                try:
+                    ...
+                finally:
+                    conn.reset()
+                    pool.put(conn)
+
+        Event views returned by `next_event_view()` remain valid.
+        """
+        if self._slot is not None:
+            self._slot.release()
+            self._slot = None
+        self._receive_buffer = b""
+        self._read_pos = 0
+        self._malformed = False
+        self.closed = False
 
     def __iter__(self):
-        while (event := self.next_event()) not in {CONNECTION_CLOSED, NEED_DATA}:
+        next_event = self.next_event
+        while True:
+            event = next_event()
+            if event is NEED_DATA or event is CONNECTION_CLOSED:
+                return
+            yield event
+
+
+def _drain(conn, batches):
+    """Yields the events of each batch returned by conn. Raises ValueError,
+    after the events of its batch, if malformed data was found"""
+    for events in batches:
+        yield from events
+        if conn._malformed:
+            conn.next_events()  # raises and closes the connection
+
+
+async def _async_drain(conn, batches):
+    """Same as `_drain()` for an async iterable of batches"""
+    async for events in batches:
+        for event in events:
             yield event
+        if conn._malformed:
+            conn.next_events()  # raises and closes the connection
+
+
+def _read_batches(conn, readinto, size):
+    """Reads into the connection buffer until the reader is exhausted and
+    yields the events of each read"""
+    while not conn.closed:
+        size_read = readinto(conn.recv_slot(size))
+        if size_read is None:
+            conn.close()
+            raise ValueError("No data available: non-blocking reader not supported")
+        conn.commit(size_read)
+        yield conn.next_events()
+
+
+async def _async_read_batches(conn, readinto, size):
+    """Same as `_read_batches()` for an async readinto()"""
+    while not conn.closed:
+        size_read = await readinto(conn.recv_slot(size))
+        if size_read is None:
+            conn.close()
+            raise ValueError("No data available: non-blocking reader not supported")
+        conn.commit(size_read)
+        yield conn.next_events()
 
 
 def stream_payload_data(conn, data):
     """Feeds the connection with the given data and yields payload events"""
-    conn.receive_data(data)
-    for event in conn:
-        yield event
+    yield from _drain(conn, (conn.feed(data),))
 
 
 def reads(reader, size=4096):
@@ -174,8 +527,7 @@ def stream_payload(source):
             print(f"{event = !r}")
     """
     conn = Connection()
-    for chunk in source:
-        yield from stream_payload_data(conn, chunk)
+    yield from _drain(conn, map(conn.feed, source))
 
 
 async def async_stream_payload(source):
@@ -192,9 +544,47 @@ async def async_stream_payload(source):
             print(f"{event = !r}")
     """
     conn = Connection()
-    async for chunk in source:
-        for event in stream_payload_data(conn, chunk):
+    feed = conn.feed
+    async for event in _async_drain(conn, (feed(chunk) async for chunk in source)):
+        yield event
+
+
+def stream_payload_reader(reader, size=4096):
+    """
+    Consumes netstring frames from the reader and yields payloads.
+    If the reader has a readinto() method (ex: binary file, socket.SocketIO)
+    data is read directly into the connection buffer, otherwise it falls back
+    to read(size). Non-blocking readers, whose readinto() may return None,
+    are not supported. Example:
+
+    with open("messages.ns", "rb", buffering=0) as reader:
+        for event in stream_payload_reader(reader):
+            print(f"{event = !r}")
+    """
+    readinto = getattr(reader, "readinto", None)
+    if readinto is None:
+        yield from stream_payload(reads(reader, size))
+        return
+    conn = Connection()
+    yield from _drain(conn, _read_batches(conn, readinto, size))
+
+
+async def async_stream_payload_reader(reader, size=4096):
+    """
+    Consumes netstring frames from the async reader and yields payloads.
+    If the reader has an async readinto() method data is read directly into
+    the connection buffer, otherwise it falls back to read(size) (ex:
+    asyncio.StreamReader). Non-blocking readers, whose readinto() may return
+    None, are not supported.
+    """
+    readinto = getattr(reader, "readinto", None)
+    if readinto is None:
+        async for event in async_stream_payload(async_reads(reader, size)):
             yield event
+        return
+    conn = Connection()
+    async for event in _async_drain(conn, _async_read_batches(conn, readinto, size)):
+        yield event
 
 
 def stream_frame(source):
@@ -12,14 +12,22 @@ from hypothesis import given, example
 from hypothesis.strategies import binary
 
 from netstring import Connection, decode, encode, NEED_DATA, CONNECTION_CLOSED
+from netstring import COMPACT_SIZE
 from netstring import reads, async_reads
 from netstring import stream_payload_data, stream_payload, async_stream_payload
+from netstring import stream_payload_reader, async_stream_payload_reader
 from netstring import stream_frame, async_stream_frame
 
 
 DATA_EVENTS = [
     (b"bad", [], ValueError),
     (b"10:almost good,", [], ValueError),
+    (b":,", [], ValueError),
+    (b" 1:a,", [], ValueError),
+    (b"+1:a,", [], ValueError),
+    (b"-1:,", [], ValueError),
+    (21 * b"1", [], ValueError),
+    (20 * b"1", [], None),
     (b"11:       good,", [b"       good"], None),
     (b"12:almost good,", [], None),
     (b"4:good,bad", [b"good"], ValueError),
@@ -40,9 +48,16 @@ def idfn(v):
         return v[:15] + b"[...]" if len(v) > 20 else v[:20]
 
 
+@pytest.fixture(scope="module")
+def conn():
+    """A Connection shared by the tests of this module. Tests call reset()
+    before using it (once per hypothesis example)."""
+    return Connection()
+
+
 @given(binary())
-def test_netstring(payload):
-    conn = Connection()
+def test_netstring(conn, payload):
+    conn.reset()
 
     assert conn.trailing_data == (b"", False)
     assert conn.next_event() == NEED_DATA
@@ -70,6 +85,7 @@ def test_netstring(payload):
 
 
 @given(binary())
+@example(1024 * b"$")
 def test_encode(payload):
     assert f"{len(payload)}:".encode() + payload + b"," == encode(payload)
 
@@ -79,7 +95,13 @@ def test_encode(payload):
     [
         (b"bad", ValueError),
         (b"10:almost good,", ValueError),
+        (b":,", ValueError),
+        (b" 1:a,", ValueError),
+        (b"1_0:almost good,", ValueError),
+        (21 * b"0" + b"1:a,", ValueError),
         (b"14:incomplete", ValueError),
+        (b"14", ValueError),
+        (b"", ValueError),
         (b"11:       good,", b"       good"),
         (
             b'46:{"id": 0, "method": "hello", "jsonrpc": "2.0"},',
@@ -97,9 +119,16 @@ def test_decode(data, value):
             decode(data)
 
 
+def test_decode_message():
+    with pytest.raises(ValueError, match="Received frame with invalid format"):
+        decode(b"10:almost good,")
+    with pytest.raises(ValueError, match="Incomplete frame"):
+        decode(b"14:incomplete")
+
+
 @pytest.mark.parametrize("data, events, error", DATA_EVENTS, ids=idfn)
-def test_concrete(data, events, error):
-    conn = Connection()
+def test_concrete(conn, data, events, error):
+    conn.reset()
     if error:
         evts = []
         with pytest.raises(error):
@@ -112,8 +141,8 @@ def test_concrete(data, events, error):
 
 @given(binary())
 @example(b"Hello, world!")
-def test_incomplete(payload):
-    conn = Connection()
+def test_incomplete(conn, payload):
+    conn.reset()
 
     assert conn.trailing_data == (b"", False)
     assert conn.next_event() == NEED_DATA
@@ -187,6 +216,218 @@ def test_close():
         conn.next_event()
     assert conn.closed
 
+    conn = Connection()
+    conn.receive_data(b"5a:Hello,")
+    with pytest.raises(ValueError):
+        conn.next_event()
+    assert conn.closed
+
+
+def test_many_events():
+    conn = Connection()
+    frames = [encode(b"%d" % i) for i in range(2000)]
+    data = b"".join(frames)
+    conn.receive_data(data[:-2])
+    for i, frame in enumerate(frames[:-1]):
+        assert conn.next_event() == b"%d" % i
+    assert conn.next_event() == NEED_DATA
+    assert conn.trailing_data == (frames[-1][:-2], False)
+    conn.receive_data(data[-2:])
+    assert conn.next_event() == b"1999"
+    assert conn.trailing_data == (b"", False)
+    assert conn.next_event() == NEED_DATA
+
+
+def test_release_consumed():
+    conn = Connection()
+    big = encode(1_000_000 * b"x")
+    conn.receive_data(big[:500_000])
+    conn.receive_data(big[500_000:])
+    assert len(conn.next_event()) == 1_000_000
+    assert len(conn._receive_buffer) == 0
+    assert conn.feed(b"1:a,") == [b"a"]
+    assert len(conn._receive_buffer) == 0
+    assert conn.feed(big + b"1:") == [1_000_000 * b"x"]
+    assert len(conn._receive_buffer) < COMPACT_SIZE
+    assert conn.feed(b"a,") == [b"a"]
+    assert len(conn._receive_buffer) == 0
+
+
+def test_next_event_view():
+    conn = Connection()
+    assert conn.next_event_view() == NEED_DATA
+    conn.receive_data(b"5:Hello,6:world!,3:f")
+    hello = conn.next_event_view()
+    world = conn.next_event_view()
+    assert isinstance(hello, memoryview)
+    assert hello.readonly
+    assert hello == b"Hello"
+    assert world == b"world!"
+    assert conn.next_event_view() == NEED_DATA
+    conn.receive_data(b"oo,")
+    foo = conn.next_event_view()
+    assert conn.trailing_data == (b"", False)
+    conn.receive_data(b"3:ba")
+    conn.receive_data(b"r,3:")
+    bar = conn.next_event_view()
+    conn.receive_data(b"baz,")
+    assert conn.next_event_view() == b"baz"
+    assert bar == b"bar"
+    conn.close()
+    assert conn.next_event_view() == CONNECTION_CLOSED
+    assert (hello, world, foo) == (b"Hello", b"world!", b"foo")
+
+
+def test_no_copy():
+    conn = Connection(copy=False)
+    conn.receive_data(b"5:Hello,6:world!,3:f")
+    hello = conn.next_event()
+    assert isinstance(hello, memoryview)
+    assert hello.readonly
+    events = conn.next_events()
+    assert events == [b"world!"]
+    assert all(isinstance(event, memoryview) for event in events)
+    conn.receive_data(b"oo,")
+    assert list(conn) == [b"foo"]
+    events = conn.feed(b"3:bar,1:")
+    assert events == [b"bar"]
+    assert events[0].readonly
+    assert conn.feed(b"!,") == [b"!"]
+    assert hello == b"Hello"
+
+
+def test_next_events():
+    conn = Connection()
+    assert conn.next_events() == []
+    conn.receive_data(b"5:Hello,6:world!,3:f")
+    assert conn.next_events() == [b"Hello", b"world!"]
+    assert conn.next_events() == []
+    assert conn.trailing_data == (b"3:f", False)
+    conn.receive_data(b"oo,3:bar!")
+    assert conn.next_events() == [b"foo"]
+    with pytest.raises(ValueError):
+        conn.next_events()
+    assert conn.closed
+    assert conn.next_events() == []
+
+
+def test_feed():
+    conn = Connection()
+    assert conn.feed(b"5:Hello,") == [b"Hello"]
+    assert conn.trailing_data == (b"", False)
+    assert conn.feed(b"5:Hello,6:world!,3:f") == [b"Hello", b"world!"]
+    assert conn.trailing_data == (b"3:f", False)
+    assert conn.feed(b"oo,3:ba") == [b"foo"]
+    assert conn.feed(bytearray(b"r,")) == [b"bar"]
+    assert conn.feed(b"3:foo,3:bar!") == [b"foo"]
+    with pytest.raises(ValueError):
+        conn.feed(b"3:foo,")
+    assert conn.closed
+    with pytest.raises(ValueError):
+        conn.feed(b"3:foo,")
+
+    conn = Connection()
+    with pytest.raises(ValueError):
+        conn.feed(b"3:foo!")
+    assert conn.closed
+
+    conn = Connection()
+    assert conn.feed(b"") == []
+    assert conn.closed
+
+
+def test_iter():
+    conn = Connection()
+    assert list(conn) == []
+    conn.receive_data(b"5:Hello,6:world!,3:f")
+    assert list(conn) == [b"Hello", b"world!"]
+    conn.receive_data(b"oo,")
+    conn.close()
+    assert list(conn) == []
+
+
+def test_reset():
+    conn = Connection()
+    conn.receive_data(b"5:Hello,3:f")
+    hello = conn.next_event_view()
+    conn.reset()
+    assert conn.trailing_data == (b"", False)
+    assert conn.next_event() == NEED_DATA
+    assert hello == b"Hello"
+    conn.recv_slot(8)
+    conn.reset()
+    with pytest.raises(ValueError):
+        conn.commit(0)
+    conn.receive_data(b"3:foo,")
+    conn.close()
+    conn.reset()
+    assert conn.trailing_data == (b"", False)
+    assert conn.feed(b"3:foo,") == [b"foo"]
+
+
+def test_recv_slot():
+    conn = Connection()
+    with pytest.raises(ValueError):
+        conn.commit(0)
+    slot = conn.recv_slot(8)
+    assert len(slot) == 8
+    slot[:4] = b"5:He"
+    conn.commit(4)
+    assert conn.trailing_data == (b"5:He", False)
+    assert conn.next_event() == NEED_DATA
+    slot = conn.recv_slot(8)
+    with pytest.raises(ValueError):
+        conn.commit(9)
+    slot[:8] = b"llo,3:fo"
+    conn.commit(8)
+    hello = conn.next_event_view()
+    assert hello == b"Hello"
+    slot = conn.recv_slot(8)[:2]
+    slot[:] = b"o,"
+    conn.commit(2)
+    assert conn.next_event() == b"foo"
+    assert conn.trailing_data == (b"", False)
+    conn.recv_slot(8)
+    conn.commit(0)
+    assert conn.trailing_data == (b"", True)
+    assert conn.next_event() == CONNECTION_CLOSED
+    with pytest.raises(ValueError):
+        conn.recv_slot(8)
+    assert hello == b"Hello"
+
+
+def test_recv_slot_pending():
+    conn = Connection()
+    conn.receive_data(b"1:a,1:")
+    slot = conn.recv_slot(4)
+    assert conn.trailing_data == (b"1:a,1:", False)
+    for call, args in (
+        (conn.recv_slot, (4,)),
+        (conn.receive_data, (b"b,",)),
+        (conn.feed, (b"b,",)),
+        (conn.next_event, ()),
+        (conn.next_event_view, ()),
+        (conn.next_events, ()),
+        (list, (conn,)),
+    ):
+        with pytest.raises(ValueError):
+            call(*args)
+    slot[:2] = b"b,"
+    conn.commit(2)
+    assert conn.trailing_data == (b"1:a,1:b,", False)
+    assert conn.next_events() == [b"a", b"b"]
+
+    conn.recv_slot(4)
+    conn.close()
+    assert conn.trailing_data == (b"", True)
+    with pytest.raises(ValueError):
+        conn.commit(0)
+
+    conn.reset()
+    conn.recv_slot(0)
+    with pytest.raises(ValueError):
+        conn.feed(b"1:a,")
+
 
 # @pytest.mark.parametrize("data", [d[0] for d in DATA_EVENTS], ids=idfn)
 @given(binary())
@@ -266,6 +507,69 @@ async def test_async_stream_payload(data, events, error):
         assert [e async for e in strm] == events
 
 
+@pytest.mark.parametrize("data, events, error", DATA_EVENTS, ids=idfn)
+def test_stream_payload_reader(data, events, error):
+    class Reader:
+        def __init__(self, data):
+            self.read = io.BytesIO(data).read
+
+    for reader in (io.BytesIO(data), Reader(data)):
+        strm = stream_payload_reader(reader)
+        if error:
+            with pytest.raises(error):
+                evts = []
+                for event in strm:
+                    evts.append(event)
+            assert evts == events
+        else:
+            assert list(strm) == events
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("data, events, error", DATA_EVENTS, ids=idfn)
+async def test_async_stream_payload_reader(data, events, error):
+    class Reader:
+        def __init__(self, data):
+            self.reader = io.BytesIO(data)
+
+        async def read(self, size):
+            return self.reader.read(size)
+
+    class IntoReader(Reader):
+        async def readinto(self, buffer):
+            return self.reader.readinto(buffer)
+
+    for reader in (Reader(data), IntoReader(data)):
+        strm = async_stream_payload_reader(reader)
+        if error:
+            with pytest.raises(error):
+                evts = []
+                async for event in strm:
+                    evts.append(event)
+            assert evts == events
+        else:
+            assert [e async for e in strm] == events
+
+
+def test_stream_payload_reader_non_blocking():
+    class Reader:
+        def readinto(self, buffer):
+            return None
+
+    with pytest.raises(ValueError, match="non-blocking"):
+        list(stream_payload_reader(Reader()))
+
+
+@pytest.mark.asyncio
+async def test_async_stream_payload_reader_non_blocking():
+    class Reader:
+        async def readinto(self, buffer):
+            return None
+
+    with pytest.raises(ValueError, match="non-blocking"):
+        [e async for e in async_stream_payload_reader(Reader())]
+
+
 @pytest.mark.parametrize(
     "payloads, expected", [[[b"f1", b"f2", b"f3"], [b"2:f1,", b"2:f2,", b"2:f3,"]]]
 )